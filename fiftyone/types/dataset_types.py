@@ -466,6 +466,7 @@ class OpenImagesV6Dataset(ImageDetectionDataset):
                         <mask_filename0>.<ext>
                         <mask_filename1>.<ext>
                         ...
+                    <starting-char1>.zip
                     ...
             metadata/
                 attributes.csv
@@ -486,6 +487,11 @@ class OpenImagesV6Dataset(ImageDetectionDataset):
     -   Segmentations: ``labels/segmentations.csv``, ``labels/masks/``, and
         ``metadata/segmentation_classes.csv``
 
+    The ``labels/masks/<starting-char>.zip`` archives are only present when
+    the zoo has extracted a subset of their masks, so that the remaining masks
+    can be extracted later without downloading the archive again. They are not
+    required to load the dataset.
+
     The ``hierarchy.json`` file is only used when performing Open Images-style
     detection evaluation.
 
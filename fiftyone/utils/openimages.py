@@ -9,11 +9,17 @@ dataset.
 """
 from collections import defaultdict
 import csv
+from functools import lru_cache
 import logging
+import multiprocessing
+import multiprocessing.dummy
 import os
 import random
 import warnings
+import zipfile
 
+import cv2
+import numpy as np
 import pandas as pd
 
 import eta.core.image as etai
@@ -297,17 +303,11 @@ class OpenImagesV6DatasetImporter(foud.LabeledImageDatasetImporter):
 
             # Prioritize samples with all labels, then any, then extras
             not_all_ids = any_label_ids - all_label_ids
-            all_label_ids = sorted(all_label_ids)
-            not_all_ids = sorted(not_all_ids)
-            extra_ids = sorted(extra_ids)
-
-            if shuffle:
-                random.shuffle(all_label_ids)
-                random.shuffle(not_all_ids)
-                random.shuffle(extra_ids)
-
-            valid_ids = all_label_ids + not_all_ids + extra_ids
-            valid_ids = valid_ids[:max_samples]
+            valid_ids = _select_ids(
+                [all_label_ids, not_all_ids, extra_ids],
+                max_samples=max_samples,
+                shuffle=shuffle,
+            )
         else:
             if self.classes is None and self.attrs is None:
                 # No requirements were provided, so always make all samples
@@ -496,8 +496,8 @@ def download_open_images_split(
                 containing the list of image IDs to load in either of the first
                 two formats
         num_workers (None): the number of processes to use when downloading
-            individual images. By default, ``multiprocessing.cpu_count()`` is
-            used
+            individual images and segmentation mask archives. By default,
+            ``multiprocessing.cpu_count()`` is used
         shuffle (False): whether to randomly shuffle the order in which samples
             are chosen for partial downloads
         seed (None): a random seed to use when shuffling
@@ -616,17 +616,9 @@ def _setup(
     all_classes = sorted(classes_map.values())
 
     if classes is not None:
-        oi_classes = []
-        missing_classes = []
-        filtered_classes = []
-        for c in classes:
-            if c in classes_map_rev:
-                oi_classes.append(classes_map_rev[c])
-                filtered_classes.append(c)
-            else:
-                missing_classes.append(c)
-
-        classes = filtered_classes
+        classes, oi_classes, missing_classes = _map_labels(
+            classes, classes_map_rev
+        )
         if missing_classes:
             logger.warning(
                 "Ignoring invalid classes %s\nYou can view the available "
@@ -649,17 +641,7 @@ def _setup(
         if attrs is None:
             oi_attrs = [attrs_map_rev[a] for a in all_attrs]
         else:
-            oi_attrs = []
-            missing_attrs = []
-            filtered_attrs = []
-            for a in attrs:
-                if a in attrs_map_rev:
-                    oi_attrs.append(attrs_map_rev[a])
-                    filtered_attrs.append(a)
-                else:
-                    missing_attrs.append(a)
-
-            attrs = filtered_attrs
+            attrs, oi_attrs, missing_attrs = _map_labels(attrs, attrs_map_rev)
             if missing_attrs:
                 logger.warning(
                     "Ignoring invalid attributes %s\nYou can view the "
@@ -695,6 +677,21 @@ def _setup(
     )
 
 
+def _map_labels(labels, labels_map_rev):
+    found_labels = []
+    oi_labels = []
+    missing_labels = []
+    for label in labels:
+        oi_label = labels_map_rev.get(label, None)
+        if oi_label is not None:
+            found_labels.append(label)
+            oi_labels.append(oi_label)
+        else:
+            missing_labels.append(label)
+
+    return found_labels, oi_labels, missing_labels
+
+
 def _get_general_metadata_file(dataset_dir, filename, url, download=True):
     filepath = os.path.join(dataset_dir, "metadata", filename)
     if not os.path.exists(filepath):
@@ -717,8 +714,7 @@ def _get_attrs_map(dataset_dir, download=True):
     attrs_csv, did_download = _get_general_metadata_file(
         dataset_dir, "attributes.csv", url, download=download
     )
-    attrs_data = _parse_csv(attrs_csv)
-    attrs_map = {k: v for k, v in attrs_data}
+    attrs_map = _load_csv_map(attrs_csv)
     return attrs_map, did_download
 
 
@@ -727,8 +723,7 @@ def _get_classes_map(dataset_dir, download=True):
     cls_csv, did_download = _get_general_metadata_file(
         dataset_dir, "classes.csv", url, download=download
     )
-    cls_data = _parse_csv(cls_csv)
-    classes_map = {k: v for k, v in cls_data}
+    classes_map = _load_csv_map(cls_csv)
     return classes_map, did_download
 
 
@@ -747,14 +742,33 @@ def _get_seg_classes(dataset_dir, classes_map=None, download=True):
     )
     did_download |= _did_download
 
-    with open(seg_cls_txt, "r", encoding="utf8") as f:
-        seg_classes_oi = [l.rstrip("\n") for l in f]
+    seg_classes_oi = _load_lines(seg_cls_txt)
 
     seg_classes = [classes_map[c] for c in seg_classes_oi]
 
     return sorted(seg_classes), did_download
 
 
+def _load_csv_map(csv_path):
+    # Return a copy so that callers can't modify the cached map
+    return dict(_parse_csv_map(csv_path, os.path.getmtime(csv_path)))
+
+
+@lru_cache(maxsize=8)
+def _parse_csv_map(csv_path, mtime):
+    return {k: v for k, v in _iter_csv(csv_path)}
+
+
+def _load_lines(txt_path):
+    return list(_parse_lines(txt_path, os.path.getmtime(txt_path)))
+
+
+@lru_cache(maxsize=8)
+def _parse_lines(txt_path, mtime):
+    with open(txt_path, "r", encoding="utf8") as f:
+        return tuple(l.rstrip("\n") for l in f)
+
+
 def _get_hierarchy(dataset_dir, classes_map=None, download=True):
     hierarchy_path = os.path.join(dataset_dir, "metadata", "hierarchy.json")
 
@@ -807,21 +821,21 @@ def _rename_subcategories(hierarchy, classes_map):
     return hierarchy
 
 
-def _parse_csv(filename, dataframe=False, index_col=None):
-    if dataframe:
-        data = pd.read_csv(filename, index_col=index_col)
-    else:
-        with open(filename, "r", newline="", encoding="utf8") as csvfile:
-            dialect = csv.Sniffer().sniff(csvfile.read(10240))
-            csvfile.seek(0)
-            if dialect.delimiter in _CSV_DELIMITERS:
-                reader = csv.reader(csvfile, dialect)
-            else:
-                reader = csv.reader(csvfile)
+def _parse_csv(filename):
+    return list(_iter_csv(filename))
+
 
-            data = [row for row in reader]
+def _iter_csv(filename):
+    # Yields rows one at a time so that large files need not be materialized
+    with open(filename, "r", newline="", encoding="utf8") as csvfile:
+        dialect = csv.Sniffer().sniff(csvfile.read(10240))
+        csvfile.seek(0)
+        if dialect.delimiter in _CSV_DELIMITERS:
+            reader = csv.reader(csvfile, dialect)
+        else:
+            reader = csv.reader(csvfile)
 
-    return data
+        yield from reader
 
 
 def _parse_image_ids(image_ids, ignore_split=False):
@@ -976,10 +990,11 @@ def _get_all_label_data(
     rel_data = {}
     seg_data = {}
 
-    all_classes_ids = set(image_ids)
+    # `None` means that no label type has restricted these IDs yet
+    all_classes_ids = None
     any_classes_ids = set()
 
-    all_attrs_ids = set(image_ids)
+    all_attrs_ids = None
     any_attrs_ids = set()
 
     _label_types = _parse_label_types(label_types)
@@ -1010,7 +1025,7 @@ def _get_all_label_data(
         # Classifications only capture the label schema, so don't use them for
         # ID list purposes unless they were the only label type requested
         if len(_label_types) == 1:
-            all_classes_ids &= cls_all_ids
+            all_classes_ids = _intersect_ids(all_classes_ids, cls_all_ids)
             any_classes_ids |= cls_any_ids
 
     if "detections" in _label_types:
@@ -1034,7 +1049,7 @@ def _get_all_label_data(
         )
         did_download |= _did_download
 
-        all_classes_ids &= det_all_ids
+        all_classes_ids = _intersect_ids(all_classes_ids, det_all_ids)
         any_classes_ids |= det_any_ids
 
     if "relationships" in _label_types:
@@ -1058,7 +1073,7 @@ def _get_all_label_data(
         )
         did_download |= _did_download
 
-        all_attrs_ids &= rel_all_ids
+        all_attrs_ids = _intersect_ids(all_attrs_ids, rel_all_ids)
         any_attrs_ids |= rel_any_ids
 
     if "segmentations" in _label_types:
@@ -1092,7 +1107,7 @@ def _get_all_label_data(
         )
         did_download |= _did_download
 
-        all_classes_ids &= seg_all_ids
+        all_classes_ids = _intersect_ids(all_classes_ids, seg_all_ids)
         any_classes_ids |= seg_any_ids
 
     if classes is not None:
@@ -1100,15 +1115,18 @@ def _get_all_label_data(
         any_label_ids = any_classes_ids
 
         if attrs is not None:
-            all_label_ids &= all_attrs_ids
+            all_label_ids = _intersect_ids(all_label_ids, all_attrs_ids)
             any_label_ids &= any_attrs_ids
     elif attrs is not None:
         all_label_ids = all_attrs_ids
         any_label_ids = any_attrs_ids
     else:
-        all_label_ids = all_classes_ids & all_attrs_ids
+        all_label_ids = _intersect_ids(all_classes_ids, all_attrs_ids)
         any_label_ids = any_classes_ids | any_attrs_ids
 
+    if all_label_ids is None:
+        all_label_ids = set(image_ids)
+
     return (
         cls_data,
         det_data,
@@ -1120,6 +1138,18 @@ def _get_all_label_data(
     )
 
 
+def _intersect_ids(ids, other_ids):
+    # Intersects in-place rather than allocating new sets. `None` means that
+    # there is no restriction
+    if ids is None:
+        return other_ids
+
+    if other_ids is not None:
+        ids &= other_ids
+
+    return ids
+
+
 def _get_label_data(
     dataset_dir,
     image_ids,
@@ -1141,19 +1171,33 @@ def _get_label_data(
     if download_only:
         return set(), set(), {}, did_download
 
-    df = _parse_csv(csv_path, dataframe=True)
-    df.set_index("ImageID", drop=False, inplace=True)
-    df = df.loc[df.index.intersection(image_ids)]
-
     if classes is not None:
-        # Restrict by classes
         if label_type == "relationships":
             cols = ["LabelName1", "LabelName2"]
         else:
             cols = ["LabelName"]
 
-        oi_classes = set(oi_classes)
+        oi_classes = frozenset(oi_classes)
+
+    if ids_only and classes is not None:
+        # Only rows with matching labels affect which IDs are returned, so
+        # discard all other rows while parsing
+        df = _read_label_csv(
+            csv_path,
+            label_type,
+            image_ids,
+            usecols=["ImageID"] + cols,
+            label_cols=cols,
+            oi_labels=oi_classes,
+        )
+    else:
+        df = _read_label_csv(csv_path, label_type, image_ids)
 
+    label_ids = None
+    is_match = None
+
+    if classes is not None:
+        # Restrict by classes
         if track_all_ids:
             observed = defaultdict(set)
             for image_id, labels in zip(df["ImageID"].values, df[cols].values):
@@ -1161,45 +1205,107 @@ def _get_label_data(
 
             all_ids = set()
             any_ids = set()
+
+            # Bind methods locally since this loops over every labeled image
+            is_all = oi_classes.issubset
+            is_disjoint = oi_classes.isdisjoint
+            add_all = all_ids.add
+            add_any = any_ids.add
             for image_id, observed_classes in observed.items():
-                if oi_classes.issubset(observed_classes):
-                    all_ids.add(image_id)
+                if is_all(observed_classes):
+                    add_all(image_id)
 
-                if oi_classes & observed_classes:
-                    any_ids.add(image_id)
+                if not is_disjoint(observed_classes):
+                    add_any(image_id)
+
+            label_ids = set(observed.keys())
         else:
-            any_df = df[df[cols].isin(oi_classes).any(axis=1)]
+            is_match = df[cols].isin(oi_classes).any(axis=1).values
             all_ids = set()
-            any_ids = set(any_df["ImageID"].unique())
+            any_ids = set(df["ImageID"].values[is_match])
     else:
         # No class restriction
         all_ids = set()
-        any_ids = set(df["ImageID"].unique())
+        label_ids = set(df["ImageID"].unique())
+        any_ids = label_ids
 
     if ids_only:
         return all_ids, any_ids, {}, did_download
 
+    if label_ids is None:
+        label_ids = set(df["ImageID"].unique())
+
     if classes is not None:
         if only_matching:
             # Only keep the specified labels
-            relevant_df = df[df[cols].isin(oi_classes).any(axis=1)].copy()
+            if is_match is None:
+                is_match = df[cols].isin(oi_classes).any(axis=1).values
+
+            relevant_df = df[is_match]
         else:
             # Keep all labels for the relevant image IDs
             relevant_df = df.loc[df.index.intersection(any_ids)]
     else:
         relevant_df = df
 
-    relevant_df.sort_index(inplace=True)
+    relevant_df, groups, offsets = _group_rows(relevant_df)
 
     data = {
-        "all_ids": set(df["ImageID"].unique()),
+        "all_ids": label_ids,
         "relevant_ids": any_ids,
-        "df": relevant_df,
+        "columns": _get_label_arrays(relevant_df, label_type),
+        "groups": groups,
+        "offsets": offsets,
     }
 
     return all_ids, any_ids, data, did_download
 
 
+def _read_label_csv(
+    csv_path,
+    label_type,
+    image_ids,
+    usecols=None,
+    label_cols=None,
+    oi_labels=None,
+):
+    # Only parse the columns that we need, and don't infer types for string
+    # columns
+    if usecols is None:
+        usecols = _LABEL_COLUMNS[label_type]
+
+    dtype = {c: str for c in usecols if c in _STR_COLUMNS}
+
+    # Read in chunks and discard rows for other images as we go, so the full
+    # table is never held in memory at once
+    image_ids = pd.Index(image_ids).unique()
+    reader = pd.read_csv(
+        csv_path, usecols=usecols, dtype=dtype, chunksize=_CSV_CHUNK_SIZE
+    )
+
+    chunks = []
+    for chunk in reader:
+        keep = image_ids.get_indexer(chunk["ImageID"]) >= 0
+        if oi_labels is not None:
+            keep &= chunk[label_cols].isin(oi_labels).any(axis=1).values
+
+        chunks.append(chunk[keep])
+
+    if chunks:
+        df = pd.concat(chunks, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=usecols)
+
+    # Label columns contain a small number of distinct values repeated across
+    # many rows, so store them as categoricals
+    for col in usecols:
+        if col in _CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype("category")
+
+    df.set_index("ImageID", drop=False, inplace=True)
+    return df
+
+
 def _download(
     image_ids,
     downloaded_ids,
@@ -1258,17 +1364,11 @@ def _download(
             existing_ids = not_all_ids & downloaded_ids
             non_existing_ids = not_all_ids - downloaded_ids
 
-            all_label_ids = sorted(all_label_ids)
-            existing_ids = sorted(existing_ids)
-            non_existing_ids = sorted(non_existing_ids)
-
-            if shuffle:
-                random.shuffle(all_label_ids)
-                random.shuffle(existing_ids)
-                random.shuffle(non_existing_ids)
-
-            target_ids = all_label_ids + existing_ids + non_existing_ids
-            target_ids = target_ids[:max_samples]
+            target_ids = _select_ids(
+                [all_label_ids, existing_ids, non_existing_ids],
+                max_samples=max_samples,
+                shuffle=shuffle,
+            )
         else:
             # Include all samples that meet any requirement
             target_ids = sorted(any_label_ids)
@@ -1279,15 +1379,14 @@ def _download(
         if max_samples is not None:
             # Bias sampling towards already-downloaded samples
             image_ids = set(image_ids)
-            existing_ids = sorted(image_ids & downloaded_ids)
-            non_existing_ids = sorted(image_ids - downloaded_ids)
+            existing_ids = image_ids & downloaded_ids
+            non_existing_ids = image_ids - downloaded_ids
 
-            if shuffle:
-                random.shuffle(existing_ids)
-                random.shuffle(non_existing_ids)
-
-            target_ids = existing_ids + non_existing_ids
-            target_ids = target_ids[:max_samples]
+            target_ids = _select_ids(
+                [existing_ids, non_existing_ids],
+                max_samples=max_samples,
+                shuffle=shuffle,
+            )
         else:
             # Use all available samples
             target_ids = sorted(image_ids)
@@ -1308,12 +1407,17 @@ def _download(
 
     if "segmentations" in _parse_label_types(label_types):
         _did_download = _download_masks_if_necessary(
-            all_ids, dataset_dir, split, download=download
+            all_ids,
+            dataset_dir,
+            split,
+            num_workers=num_workers,
+            download=download,
         )
         did_download |= _did_download
 
     num_downloaded = _download_images_if_necessary(
         target_ids,
+        downloaded_ids,
         split,
         dataset_dir,
         num_workers=num_workers,
@@ -1326,16 +1430,110 @@ def _download(
     return num_samples, did_download
 
 
-def _get_dataframe_rows(df, image_id):
-    left = df["ImageID"].searchsorted(image_id, "left")
-    right = df["ImageID"].searchsorted(image_id, "right")
-    return df[left:right]
+def _select_ids(id_groups, max_samples=None, shuffle=False):
+    # Selects IDs from the groups in priority order. Groups are sorted so that
+    # seeded selections are reproducible, and when shuffling only the needed
+    # number of IDs are sampled from each group
+    selected_ids = []
+    for ids in id_groups:
+        if max_samples is not None:
+            num_needed = max_samples - len(selected_ids)
+            if num_needed <= 0:
+                break
+        else:
+            num_needed = len(ids)
+
+        ids = sorted(ids)
+
+        if shuffle:
+            ids = random.sample(ids, min(num_needed, len(ids)))
+        else:
+            ids = ids[:num_needed]
+
+        selected_ids.extend(ids)
+
+    return selected_ids
+
+
+def _group_rows(df):
+    # Stably reorders the rows so that each image's rows are contiguous. The
+    # rows of group `i` are then `df.iloc[offsets[i]:offsets[i + 1]]`
+    codes, uniques = pd.factorize(df["ImageID"].values)
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=len(uniques))
+    offsets = np.concatenate([[0], np.cumsum(counts)]).tolist()
+
+    df = df.iloc[order]
+    groups = dict(zip(uniques, range(len(uniques))))
+
+    return df, groups, offsets
+
+
+def _get_label_arrays(df, label_type):
+    # Converts the columns needed to build labels to arrays once for the whole
+    # table, so that each image only needs to slice them
+    if label_type == "classifications":
+        return {
+            "labels": df["LabelName"].to_numpy(dtype=object),
+            "confidences": df["Confidence"].to_numpy(dtype=float),
+        }
+
+    if label_type == "detections":
+        coords = df[["XMin", "XMax", "YMin", "YMax"]]
+        flags = df[_DETECTION_FLAGS].to_numpy(dtype=int)
+        return {
+            "labels": df["LabelName"].to_numpy(dtype=object),
+            "coords": coords.to_numpy(dtype=float),
+            "flags": flags.astype(bool),
+        }
+
+    if label_type == "relationships":
+        coords = df[
+            [
+                "XMin1",
+                "XMax1",
+                "YMin1",
+                "YMax1",
+                "XMin2",
+                "XMax2",
+                "YMin2",
+                "YMax2",
+            ]
+        ]
+        return {
+            "labels1": df["LabelName1"].to_numpy(dtype=object),
+            "labels2": df["LabelName2"].to_numpy(dtype=object),
+            "labels_rel": df["RelationshipLabel"].to_numpy(dtype=object),
+            "coords": coords.to_numpy(dtype=float),
+        }
+
+    if label_type == "segmentations":
+        coords = df[["BoxXMin", "BoxXMax", "BoxYMin", "BoxYMax"]]
+        return {
+            "mask_paths": df["MaskPath"].to_numpy(dtype=object),
+            "labels": df["LabelName"].to_numpy(dtype=object),
+            "coords": coords.to_numpy(dtype=float),
+        }
+
+    raise ValueError("Unsupported label type '%s'" % label_type)
+
+
+def _get_label_rows(data, image_id, *names):
+    # Returns the given columns of the image's rows as lists
+    idx = data["groups"].get(image_id, None)
+    if idx is None:
+        start = end = 0
+    else:
+        offsets = data["offsets"]
+        start, end = offsets[idx], offsets[idx + 1]
+
+    columns = data["columns"]
+    return [columns[name][start:end].tolist() for name in names]
 
 
 def _create_classifications(cls_data, image_id, classes_map):
     all_label_ids = cls_data["all_ids"]
     relevant_ids = cls_data["relevant_ids"]
-    df = cls_data["df"]
 
     if image_id not in all_label_ids:
         return None, None
@@ -1345,15 +1543,14 @@ def _create_classifications(cls_data, image_id, classes_map):
         neg_labels = fol.Classifications()
         return pos_labels, neg_labels
 
-    def _make_label(row):
-        # [ImageID,Source,LabelName,Confidence]
-        return fol.Classification(
-            label=classes_map[row["LabelName"]],
-            confidence=float(row["Confidence"]),
-        )
+    labels, confidences = _get_label_rows(
+        cls_data, image_id, "labels", "confidences"
+    )
 
-    matching_df = _get_dataframe_rows(df, image_id)
-    cls = [_make_label(row[1]) for row in matching_df.iterrows()]
+    cls = [
+        fol.Classification(label=classes_map[label], confidence=confidence)
+        for label, confidence in zip(labels, confidences)
+    ]
 
     pos_cls = []
     neg_cls = []
@@ -1372,7 +1569,6 @@ def _create_classifications(cls_data, image_id, classes_map):
 def _create_detections(det_data, image_id, classes_map):
     all_label_ids = det_data["all_ids"]
     relevant_ids = det_data["relevant_ids"]
-    df = det_data["df"]
 
     if image_id not in all_label_ids:
         return None
@@ -1380,34 +1576,28 @@ def _create_detections(det_data, image_id, classes_map):
     if image_id not in relevant_ids:
         return fol.Detections()
 
-    def _make_label(row):
-        # ImageID,Source,LabelName,Confidence,XMin,XMax,YMin,YMax,IsOccluded,IsTruncated,IsGroupOf,IsDepiction,IsInside
+    labels, coords, flags = _get_label_rows(
+        det_data, image_id, "labels", "coords", "flags"
+    )
 
-        xmin = float(row["XMin"])
-        xmax = float(row["XMax"])
-        ymin = float(row["YMin"])
-        ymax = float(row["YMax"])
+    dets = []
+    for label, (xmin, xmax, ymin, ymax), _flags in zip(labels, coords, flags):
         bounding_box = [xmin, ymin, xmax - xmin, ymax - ymin]
-
-        return fol.Detection(
-            bounding_box=bounding_box,
-            label=classes_map[row["LabelName"]],
-            IsOccluded=bool(int(row["IsOccluded"])),
-            IsTruncated=bool(int(row["IsTruncated"])),
-            IsGroupOf=bool(int(row["IsGroupOf"])),
-            IsDepiction=bool(int(row["IsDepiction"])),
-            IsInside=bool(int(row["IsInside"])),
+        attributes = dict(zip(_DETECTION_FLAGS, _flags))
+        dets.append(
+            fol.Detection(
+                bounding_box=bounding_box,
+                label=classes_map[label],
+                **attributes,
+            )
         )
 
-    matching_df = _get_dataframe_rows(df, image_id)
-    dets = [_make_label(row[1]) for row in matching_df.iterrows()]
     return fol.Detections(detections=dets)
 
 
 def _create_relationships(rel_data, image_id, classes_map, attrs_map):
     all_label_ids = rel_data["all_ids"]
     relevant_ids = rel_data["relevant_ids"]
-    df = rel_data["df"]
 
     if image_id not in all_label_ids:
         return None
@@ -1415,20 +1605,8 @@ def _create_relationships(rel_data, image_id, classes_map, attrs_map):
     if image_id not in relevant_ids:
         return fol.Detections()
 
-    def _make_label(row):
-        # ImageID,LabelName1,LabelName2,XMin1,XMax1,YMin1,YMax1,XMin2,XMax2,YMin2,YMax2,RelationshipLabel
-
-        oi_label1 = row["LabelName1"]
-        xmin1 = float(row["XMin1"])
-        xmax1 = float(row["XMax1"])
-        ymin1 = float(row["YMin1"])
-        ymax1 = float(row["YMax1"])
-
-        oi_label2 = row["LabelName2"]
-        xmin2 = float(row["XMin2"])
-        xmax2 = float(row["XMax2"])
-        ymin2 = float(row["YMin2"])
-        ymax2 = float(row["YMax2"])
+    def _make_label(oi_label1, oi_label2, label_rel, coords):
+        xmin1, xmax1, ymin1, ymax1, xmin2, xmax2, ymin2, ymax2 = coords
 
         if oi_label1 in classes_map:
             label1 = classes_map[oi_label1]
@@ -1440,8 +1618,6 @@ def _create_relationships(rel_data, image_id, classes_map, attrs_map):
         else:
             label2 = attrs_map[oi_label2]
 
-        label_rel = row["RelationshipLabel"]
-
         xmin_int = min(xmin1, xmin2)
         ymin_int = min(ymin1, ymin2)
         xmax_int = max(xmax1, xmax2)
@@ -1461,15 +1637,20 @@ def _create_relationships(rel_data, image_id, classes_map, attrs_map):
             Label2=label2,
         )
 
-    matching_df = _get_dataframe_rows(df, image_id)
-    rels = [_make_label(row[1]) for row in matching_df.iterrows()]
+    labels1, labels2, labels_rel, coords = _get_label_rows(
+        rel_data, image_id, "labels1", "labels2", "labels_rel", "coords"
+    )
+
+    rels = [
+        _make_label(*args)
+        for args in zip(labels1, labels2, labels_rel, coords)
+    ]
     return fol.Detections(detections=rels)
 
 
 def _create_segmentations(seg_data, image_id, classes_map, dataset_dir):
     all_label_ids = seg_data["all_ids"]
     relevant_ids = seg_data["relevant_ids"]
-    df = seg_data["df"]
 
     if image_id not in all_label_ids:
         return None
@@ -1477,39 +1658,40 @@ def _create_segmentations(seg_data, image_id, classes_map, dataset_dir):
     if image_id not in relevant_ids:
         return fol.Detections()
 
-    def _make_label(row):
-        # MaskPath,ImageID,LabelName,BoxID,BoxXMin,BoxXMax,BoxYMin,BoxYMax,PredictedIoU,Clicks
+    masks_dir = os.path.join(
+        dataset_dir, "labels", "masks", image_id[0].upper()
+    )
 
-        mask_path = row["MaskPath"]
-        label = classes_map[row["LabelName"]]
-        xmin = float(row["BoxXMin"])
-        xmax = float(row["BoxXMax"])
-        ymin = float(row["BoxYMin"])
-        ymax = float(row["BoxYMax"])
+    def _make_label(mask_path, oi_label, coords):
+        label = classes_map[oi_label]
+        xmin, xmax, ymin, ymax = coords
 
         # Convert to [top-left-x, top-left-y, width, height]
         bbox = [xmin, ymin, xmax - xmin, ymax - ymin]
 
         # Load boolean mask
-        mask_path = os.path.join(
-            dataset_dir, "labels", "masks", image_id[0].upper(), mask_path,
-        )
+        mask_path = os.path.join(masks_dir, mask_path)
         if not os.path.isfile(mask_path):
-            msg = "Segmentation file %s does not exist", mask_path
+            msg = "Segmentation file %s does not exist" % mask_path
             warnings.warn(msg)
             return None
 
-        rgb_mask = etai.read(mask_path)
-        mask = etai.rgb_to_gray(rgb_mask) > 122
-        h, w = mask.shape
-        cropped_mask = mask[
-            int(ymin * h) : int(ymax * h), int(xmin * w) : int(xmax * w)
-        ]
+        # Decode directly to grayscale rather than to RGB and then converting
+        gray_mask = etai.read(mask_path, flag=cv2.IMREAD_GRAYSCALE)
+
+        # Crop before thresholding so only the box region is binarized
+        h, w = gray_mask.shape
+        y0, y1 = int(ymin * h), int(ymax * h)
+        x0, x1 = int(xmin * w), int(xmax * w)
+        cropped_mask = gray_mask[y0:y1, x0:x1] > 122
 
         return fol.Detection(bounding_box=bbox, label=label, mask=cropped_mask)
 
-    matching_df = _get_dataframe_rows(df, image_id)
-    segs = [_make_label(row[1]) for row in matching_df.iterrows()]
+    mask_paths, labels, coords = _get_label_rows(
+        seg_data, image_id, "mask_paths", "labels", "coords"
+    )
+
+    segs = [_make_label(*args) for args in zip(mask_paths, labels, coords)]
     segs = [s for s in segs if s is not None]
     return fol.Detections(detections=segs)
 
@@ -1523,23 +1705,16 @@ def _load_all_image_ids(dataset_dir, split=None, download=True):
         csv_filepath, url, quiet=quiet, download=download
     )
 
-    csv_data = _parse_csv(csv_filepath)
-    image_ids = [i[0].strip() for i in csv_data[1:]]
+    rows = _iter_csv(csv_filepath)
+    next(rows, None)  # skip header
+    image_ids = [row[0].strip() for row in rows]
 
     return image_ids, did_download
 
 
-def _download_file_if_necessary(
-    filepath, url, is_zip=False, quiet=-1, download=True
-):
+def _download_file_if_necessary(filepath, url, quiet=-1, download=True):
     did_download = False
 
-    if is_zip:
-        # Check if unzipped directory exists
-        unzipped_dir = os.path.splitext(filepath)[0]
-        if os.path.isdir(unzipped_dir):
-            return did_download
-
     if not os.path.isfile(filepath):
         if not download:
             raise ValueError("File '%s' is not downloaded" % filepath)
@@ -1551,44 +1726,124 @@ def _download_file_if_necessary(
         etaw.download_file(url, path=filepath, quiet=quiet != -1)
         did_download = True
 
-    if is_zip:
-        etau.extract_zip(filepath, outdir=unzipped_dir, delete_zip=True)
-
     return did_download
 
 
-def _download_masks_if_necessary(image_ids, dataset_dir, split, download=True):
-    seg_zip_names = list({i[0].upper() for i in image_ids})
+def _download_masks_if_necessary(
+    image_ids, dataset_dir, split, num_workers=None, download=True
+):
     mask_urls = _ANNOTATION_DOWNLOAD_URLS[split]["segmentations"]["mask_data"]
     masks_dir = os.path.join(dataset_dir, "labels", "masks")
+    seg_csv = os.path.join(dataset_dir, "labels", "segmentations.csv")
 
     quiet = 1 if split == "validation" else 0
-    did_download = False
-    for zip_name in seg_zip_names:
+
+    # A shard directory without an archive alongside it was fully extracted.
+    # An archive is only kept while some of its masks remain unextracted
+    zip_names = set()
+    for zip_name in {i[0].upper() for i in image_ids}:
+        unzipped_dir = os.path.join(masks_dir, zip_name)
+        zip_path = unzipped_dir + ".zip"
+        if not os.path.isdir(unzipped_dir) or os.path.isfile(zip_path):
+            zip_names.add(zip_name)
+
+    if not zip_names:
+        return False
+
+    # Determine the masks required by the given images, grouped by archive
+    shard_ids = [i for i in image_ids if i[0].upper() in zip_names]
+    df = _read_label_csv(
+        seg_csv, "segmentations", shard_ids, usecols=["MaskPath", "ImageID"]
+    )
+    needed_masks = defaultdict(set)
+    rows = zip(df["ImageID"].values, df["MaskPath"].values)
+    for image_id, mask_path in rows:
+        needed_masks[image_id[0].upper()].add(mask_path)
+
+    tasks = []
+    for zip_name, mask_paths in sorted(needed_masks.items()):
+        unzipped_dir = os.path.join(masks_dir, zip_name)
+        if os.path.isdir(unzipped_dir):
+            missing_masks = mask_paths - set(os.listdir(unzipped_dir))
+        else:
+            missing_masks = mask_paths
+
+        if not missing_masks:
+            continue
+
         url = mask_urls[zip_name]
-        zip_path = os.path.join(masks_dir, zip_name + ".zip")
-        _did_download = _download_file_if_necessary(
-            zip_path, url, is_zip=True, quiet=quiet, download=download
+        zip_path = unzipped_dir + ".zip"
+        tasks.append((zip_path, url, missing_masks, quiet, download))
+
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    num_workers = min(num_workers, len(tasks))
+
+    if num_workers <= 1:
+        results = [_do_download_masks(task) for task in tasks]
+    else:
+        with multiprocessing.dummy.Pool(num_workers) as pool:
+            results = pool.map(_do_download_masks, tasks)
+
+    return any(results)
+
+
+def _do_download_masks(args):
+    zip_path, url, mask_paths, quiet, download = args
+
+    did_download = _download_file_if_necessary(
+        zip_path, url, quiet=quiet, download=download
+    )
+
+    # Only extract the necessary masks
+    unzipped_dir = os.path.splitext(zip_path)[0]
+    num_extracted = 0
+    with zipfile.ZipFile(zip_path) as zf:
+        names = zf.namelist()
+        for name in names:
+            if name in mask_paths:
+                zf.extract(name, path=unzipped_dir)
+                num_extracted += 1
+
+    missing_masks = mask_paths.difference(names)
+    if missing_masks:
+        logger.warning(
+            "%d masks were not found in '%s'",
+            len(missing_masks),
+            zip_path,
         )
-        did_download |= _did_download
 
-    return did_download
+    # The archive is kept so that masks for other images can be extracted
+    # later without downloading it again, until all of its masks have been
+    # extracted
+    if os.path.isdir(unzipped_dir):
+        if set(os.listdir(unzipped_dir)).issuperset(names):
+            os.remove(zip_path)
+
+    return did_download or num_extracted > 0
 
 
 def _download_images_if_necessary(
-    image_ids, split, dataset_dir, num_workers=None, download=True
+    image_ids,
+    downloaded_ids,
+    split,
+    dataset_dir,
+    num_workers=None,
+    download=True,
 ):
     data_dir = os.path.join(dataset_dir, "data")
     etau.ensure_dir(data_dir)
 
+    # AWS path, always use "/"
+    url_prefix = "s3://%s/%s/" % (_BUCKET_NAME, split)
+
     urls = {}
     num_existing = 0
     for image_id in image_ids:
-        filepath = os.path.join(data_dir, image_id + ".jpg")
-        obj = split + "/" + image_id + ".jpg"  # AWS path, always use "/"
-        if not os.path.isfile(filepath):
-            url = "s3://%s/%s" % (_BUCKET_NAME, obj)
-            urls[url] = filepath
+        if image_id not in downloaded_ids:
+            filename = image_id + ".jpg"
+            urls[url_prefix + filename] = os.path.join(data_dir, filename)
         else:
             num_existing += 1
 
@@ -1720,8 +1975,74 @@ _ANNOTATION_DOWNLOAD_URLS = {
 
 _BUCKET_NAME = "open-images-dataset"
 
+_CSV_CHUNK_SIZE = 1000000
+
 _CSV_DELIMITERS = [",", ";", ":", " ", "\t", "\n"]
 
+_LABEL_COLUMNS = {
+    "classifications": ["ImageID", "LabelName", "Confidence"],
+    "detections": [
+        "ImageID",
+        "LabelName",
+        "XMin",
+        "XMax",
+        "YMin",
+        "YMax",
+        "IsOccluded",
+        "IsTruncated",
+        "IsGroupOf",
+        "IsDepiction",
+        "IsInside",
+    ],
+    "relationships": [
+        "ImageID",
+        "LabelName1",
+        "LabelName2",
+        "XMin1",
+        "XMax1",
+        "YMin1",
+        "YMax1",
+        "XMin2",
+        "XMax2",
+        "YMin2",
+        "YMax2",
+        "RelationshipLabel",
+    ],
+    "segmentations": [
+        "MaskPath",
+        "ImageID",
+        "LabelName",
+        "BoxXMin",
+        "BoxXMax",
+        "BoxYMin",
+        "BoxYMax",
+    ],
+}
+
+_DETECTION_FLAGS = [
+    "IsOccluded",
+    "IsTruncated",
+    "IsGroupOf",
+    "IsDepiction",
+    "IsInside",
+]
+
+_CATEGORICAL_COLUMNS = {
+    "LabelName",
+    "LabelName1",
+    "LabelName2",
+    "RelationshipLabel",
+}
+
+_STR_COLUMNS = {
+    "ImageID",
+    "LabelName",
+    "LabelName1",
+    "LabelName2",
+    "RelationshipLabel",
+    "MaskPath",
+}
+
 _SUPPORTED_LABEL_TYPES = [
     "classifications",
     "detections",
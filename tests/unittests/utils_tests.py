@@ -5,17 +5,22 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
 import time
 import unittest
+import zipfile
 
 from mongoengine.errors import ValidationError
 import numpy as np
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.media as fom
 import fiftyone.core.uid as fou
 from fiftyone.migrations.runner import MigrationRunner
+import fiftyone.utils.openimages as fouo
 
 from decorators import drop_datasets
 
@@ -236,6 +241,92 @@ class MigrationTests(unittest.TestCase):
             MigrationRunner(head=future_ver, destination="0.1")
 
 
+class OpenImagesMasksTests(unittest.TestCase):
+    def _make_dataset(self, dataset_dir, masks, archives):
+        labels_dir = os.path.join(dataset_dir, "labels")
+        masks_dir = os.path.join(labels_dir, "masks")
+        etau.ensure_dir(masks_dir)
+
+        with open(os.path.join(labels_dir, "segmentations.csv"), "w") as f:
+            f.write("MaskPath,ImageID,LabelName\n")
+            for image_id, mask_path in masks:
+                f.write("%s,%s,/m/01\n" % (mask_path, image_id))
+
+        for zip_name, mask_paths in archives.items():
+            zip_path = os.path.join(masks_dir, zip_name + ".zip")
+            with zipfile.ZipFile(zip_path, "w") as zf:
+                for mask_path in mask_paths:
+                    zf.writestr(mask_path, b"")
+
+        return masks_dir
+
+    def _download_masks(self, image_ids, dataset_dir):
+        return fouo._download_masks_if_necessary(
+            image_ids,
+            dataset_dir,
+            "validation",
+            num_workers=1,
+            download=False,
+        )
+
+    def test_partial_extraction(self):
+        masks = [
+            ("a1", "a1_m0.png"),
+            ("a1", "a1_m1.png"),
+            ("a2", "a2_m0.png"),
+            ("a3", "a3_m0.png"),
+        ]
+        archives = {"A": [m for _, m in masks]}
+
+        with etau.TempDir() as dataset_dir:
+            masks_dir = self._make_dataset(dataset_dir, masks, archives)
+            zip_path = os.path.join(masks_dir, "A.zip")
+            unzipped_dir = os.path.join(masks_dir, "A")
+
+            # Only the requested masks are extracted and the archive is kept
+            self.assertTrue(self._download_masks(["a1"], dataset_dir))
+            self.assertSetEqual(
+                set(os.listdir(unzipped_dir)), {"a1_m0.png", "a1_m1.png"}
+            )
+            self.assertTrue(os.path.isfile(zip_path))
+
+            # Nothing to do when all requested masks are already extracted
+            self.assertFalse(self._download_masks(["a1"], dataset_dir))
+
+            # New images in the same shard reuse the kept archive
+            self.assertTrue(self._download_masks(["a1", "a2"], dataset_dir))
+            self.assertSetEqual(
+                set(os.listdir(unzipped_dir)),
+                {"a1_m0.png", "a1_m1.png", "a2_m0.png"},
+            )
+            self.assertTrue(os.path.isfile(zip_path))
+
+            # The archive is deleted once all of its masks are extracted
+            self.assertTrue(self._download_masks(["a3"], dataset_dir))
+            self.assertSetEqual(
+                set(os.listdir(unzipped_dir)), set(archives["A"])
+            )
+            self.assertFalse(os.path.isfile(zip_path))
+
+            # A fully extracted shard is skipped
+            self.assertFalse(
+                self._download_masks(["a1", "a2", "a3"], dataset_dir)
+            )
+
+    def test_missing_masks(self):
+        masks = [("b1", "b1_m0.png")]
+        archives = {"B": ["b2_m0.png"]}
+
+        with etau.TempDir() as dataset_dir:
+            masks_dir = self._make_dataset(dataset_dir, masks, archives)
+
+            with self.assertLogs(fouo.logger, level="WARNING"):
+                self.assertFalse(self._download_masks(["b1"], dataset_dir))
+
+            self.assertFalse(os.path.isdir(os.path.join(masks_dir, "B")))
+            self.assertTrue(os.path.isfile(os.path.join(masks_dir, "B.zip")))
+
+
 class UIDTests(unittest.TestCase):
     def test_log_import(self):
         fo.config.do_not_track = False